@@ -653,7 +653,8 @@ def sort_dict_by_name(d, pref_list: list = None) -> dict:
         if k in d:
             s[k] = d[k]
     for k in sorted_keys:
-        if k not in pref_list:
+        # keys from pref_list that exist in d are already in s
+        if k not in s:
             s[k] = d[k]
     return s
 
@@ -1,5 +1,5 @@
 import abc
-from fnmatch import fnmatch
+import fnmatch
 
 from pyaerocom._lowlevel_helpers import BrowseDict
 from pyaerocom.aeroval.modelentry import ModelEntry
@@ -47,10 +47,8 @@ class BaseCollection(BrowseDict, abc.ABC):
         if name_or_pattern is None:
             name_or_pattern = "*"
 
-        matches = []
-        for key in self.keys():
-            if fnmatch(key, name_or_pattern) and key not in matches:
-                matches.append(key)
+        # dict keys are unique, so no need to check for duplicates
+        matches = fnmatch.filter(self.keys(), name_or_pattern)
         if len(matches) == 0:
             raise KeyError(f"No matches could be found that match input {name_or_pattern}")
         return matches
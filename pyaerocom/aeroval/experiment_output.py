@@ -298,25 +298,17 @@ class ExperimentOutput(ProjectOutput):
         str
             Time period
         """
-        spl = os.path.basename(filename).split(".json")[0].split("_")
+        spl = os.path.basename(filename).partition(".json")[0].split("_")
         if len(spl) != 4:
             raise ValueError(
                 f"invalid map filename: {filename}. Must "
                 f"contain exactly 3 underscores _ to separate "
                 f"obsinfo, vertical, model info, and periods"
             )
-        obsinfo = spl[0]
-        vert_code = spl[1]
-        modinfo = spl[2]
-        time_period = spl[3]
+        obsinfo, vert_code, modinfo, time_period = spl
 
-        mspl = modinfo.split("-")
-        mod_var = mspl[-1]
-        mod_id = "-".join(mspl[:-1])
-
-        ospl = obsinfo.split("-")
-        obs_var = ospl[-1]
-        obs_network = "-".join(ospl[:-1])
+        mod_id, _, mod_var = modinfo.rpartition("-")
+        obs_network, _, obs_var = obsinfo.rpartition("-")
 
         return MapInfo(obs_network, obs_var, vert_code, mod_id, mod_var, time_period)
 
@@ -373,7 +365,7 @@ class ExperimentOutput(ProjectOutput):
             elif vert_code not in vert_codes:
                 rmmap.append(file_path)
 
-        scatfiles = os.listdir(outdirs["scat"])
+        scatfiles = set(os.listdir(outdirs["scat"]))
         for file_path in rmmap:  # delete map files
             logger.info(f"Deleting outdated map json file: {file_path}.")
             os.remove(file_path)
@@ -425,8 +417,8 @@ class ExperimentOutput(ProjectOutput):
                 return True
 
             models_avail = list(data)
-            models_in_exp = self.cfg.model_cfg.web_interface_names
-            if all([mod in models_in_exp for mod in models_avail]):
+            models_in_exp = set(self.cfg.model_cfg.web_interface_names)
+            if models_in_exp.issuperset(models_avail):
                 # nothing to clean up
                 return False
             modified = False
@@ -884,8 +876,9 @@ class ExperimentOutput(ProjectOutput):
         with self.avdb.lock():
             current = self.avdb.get_experiments(self.proj_id, default={})
 
-            current = sort_dict_by_name(current, pref_list=exp_order)
-            self.avdb.put_experiments(current, self.proj_id)
+            ordered = sort_dict_by_name(current, pref_list=exp_order)
+            if list(ordered) != list(current):
+                self.avdb.put_experiments(ordered, self.proj_id)
 
     def add_heatmap_timeseries_entry(
         self,
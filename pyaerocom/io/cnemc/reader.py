@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
 from collections import defaultdict
 from collections.abc import Iterable
-from functools import cached_property, lru_cache
+from functools import cache, cached_property, lru_cache
 from pathlib import Path
 
 import xarray as xr
@@ -94,7 +95,7 @@ class ReadCNEMC(ReadUngriddedBase):
         "concso2": "SO2_density",
     }
 
-    STATION_REGEX = re.compile("mep-rd-(.*A)-.*.nc")
+    STATION_REGEX = re.compile(r"mep-rd-(.*A)-.*\.nc")
 
     DEFAULT_VARS = list(VAR_MAPPING)
 
@@ -102,12 +103,16 @@ class ReadCNEMC(ReadUngriddedBase):
 
     PROVIDES_VARIABLES = list(VAR_MAPPING) + list(AUX_FUNS)
 
+    #: maximum number of opened station datasets kept by a reader instance
+    MAX_CACHED_DATASETS = 8
+
     def __init__(self, data_id: str | None = None, data_dir: str | None = None):
         if data_dir is None:
             data_dir = const.OBSLOCS_UNGRIDDED[const.CNEMC_NAME]
 
         super().__init__(data_id=data_id, data_dir=data_dir)
         self.files = sorted(map(str, self.FOUND_FILES))
+        self._dataset_cache: dict[tuple[tuple[str, int], ...], xr.Dataset] = {}
 
     @cached_property
     def FOUND_FILES(self) -> tuple[Path, ...]:
@@ -124,7 +129,7 @@ class ReadCNEMC(ReadUngriddedBase):
         for path in files:
             if not isinstance(path, Path):
                 path = Path(path)
-            if (name := self._station_name(path)) is None:
+            if (name := self._station_name(path.name)) is None:
                 logger.debug(f"Skipping {path.name}")
                 continue
             stations[name].append(path)
@@ -133,8 +138,10 @@ class ReadCNEMC(ReadUngriddedBase):
         return stations
 
     @classmethod
-    def _station_name(cls, path: Path) -> str | None:
-        match = cls.STATION_REGEX.search(path.name)
+    @cache
+    def _station_name(cls, filename: str) -> str | None:
+        # file names start with the station prefix, so an anchored match suffices
+        match = cls.STATION_REGEX.match(filename)
         return match.group(1) if match else None
 
     def read_file(
@@ -174,22 +181,62 @@ class ReadCNEMC(ReadUngriddedBase):
 
         for station_name, paths in self.stations(files).items():
             logger.debug(f"Reading station {station_name}")
-            ds = self._read_dataset(paths)[vars_to_retrieve]
+            ds = self._read_dataset(paths, vars_to_retrieve)[vars_to_retrieve]
             stations.append(self.to_stationdata(ds, station_name))
 
         return UngriddedData.from_station_data(stations)
 
-    def _read_dataset(self, paths: list[Path]) -> xr.Dataset:
-        ds = xr.open_mfdataset(
-            sorted(paths), concat_dim="time", combine="nested", parallel=True, decode_cf=True
-        )
+    def _read_dataset(
+        self, paths: list[Path], vars_to_retrieve: Iterable[str] | None = None
+    ) -> xr.Dataset:
+        ds = self._open_dataset(tuple(sorted(map(str, paths))))
         ds = ds.rename({v: k for k, v in self.VAR_MAPPING.items()})
+        # only compute the auxiliary variables that were requested
+        aux_funs = self.AUX_FUNS
+        if vars_to_retrieve is not None:
+            aux_funs = {k: v for k, v in aux_funs.items() if k in vars_to_retrieve}
         ds = ds.assign(
             time=self._dataset_time(ds),
-            **{name: func(ds) for name, func in self.AUX_FUNS.items()},
+            **{name: func(ds) for name, func in aux_funs.items()},
         )
         return ds.set_coords(("latitude", "longitude", "altitude"))
 
+    def _open_dataset(self, paths: tuple[str, ...]) -> xr.Dataset:
+        """Open (lazily) the files of one station as a single dataset
+
+        Opened datasets are kept by this reader instance (at most
+        :attr:`MAX_CACHED_DATASETS`), keyed on file paths and modification
+        times, so that reading the same station again (e.g. one variable at a
+        time) does not reopen unchanged files. The returned dataset must not
+        be modified in place.
+        """
+        key = tuple((path, os.stat(path).st_mtime_ns) for path in paths)
+        ds = self._dataset_cache.pop(key, None)
+        if ds is None:
+            ds = xr.open_mfdataset(
+                list(paths),
+                concat_dim="time",
+                combine="nested",
+                parallel=True,
+                decode_cf=True,
+                data_vars="minimal",
+                coords="minimal",
+                compat="override",
+                chunks={"time": -1},
+            )
+            if len(self._dataset_cache) >= self.MAX_CACHED_DATASETS:
+                # evict least recently used
+                self._dataset_cache.pop(next(iter(self._dataset_cache))).close()
+        # (re)insert as most recently used
+        self._dataset_cache[key] = ds
+        return ds
+
+    def clear_dataset_cache(self) -> None:
+        """Close all station datasets kept open by this reader"""
+        for ds in self._dataset_cache.values():
+            ds.close()
+        self._dataset_cache.clear()
+
     @classmethod
     def _dataset_time(cls, ds: xr.Dataset) -> xr.DataArray:
         # can not add ds["datetime_start"] and ds["datetime_start"], as both are of type datetime[ns]
@@ -225,7 +272,7 @@ class ReadCNEMC(ReadUngriddedBase):
         station["dtime"] = ds["time"].values
 
         for var in ds.data_vars:
-            station[var] = ds[var].to_series()
+            station[var] = ds[var].values
             station["var_info"][var] = {"units": ds[var].units}
 
         return station
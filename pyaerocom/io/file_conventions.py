@@ -113,14 +113,13 @@ class FileConventionRead:
         ts_pos: -1
         """
 
-        if basename(file).count("_") >= 4:
+        filename = basename(file)
+        if filename.count("_") >= 4:
             self.import_default("aerocom3")
-        elif basename(file).count(".") >= 4:
+        elif filename.count(".") >= 4:
             self.import_default("aerocom2")
         else:
-            raise FileConventionError(
-                f"Could not identify convention from input file {basename(file)}"
-            )
+            raise FileConventionError(f"Could not identify convention from input file {filename}")
         self.check_validity(file)
         return self
 
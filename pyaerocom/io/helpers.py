@@ -7,9 +7,8 @@ from __future__ import annotations
 import logging
 import os
 import shutil
-from datetime import datetime
 from pathlib import Path
-from time import time
+from time import monotonic, time
 
 import simplejson as json
 
@@ -82,13 +81,15 @@ def aerocom_savename(data_id, var_name, vert_code, year, ts_type):
 def _print_read_info(i, mod, tot_num, last_t, name, logger):  # pragma: no cover
     """Helper for displaying standardised output in reading classes
 
-    Not to be used directly
+    Not to be used directly. ``last_t`` and the returned value are
+    :func:`time.monotonic` values (wall clock time is part of the log
+    format).
     """
-    t = datetime.now()
-    logger.info(
-        f"Reading files {i+1}-{i+1+mod} of {tot_num} "
-        f"({name}) | {t:%T} (delta = {(t-last_t).seconds} s')"
-    )
+    t = monotonic()
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            f"Reading files {i+1}-{i+1+mod} of {tot_num} ({name}) | delta = {t-last_t:.0f} s"
+        )
     return t
 
 
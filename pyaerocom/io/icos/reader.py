@@ -67,7 +67,7 @@ class ReadICOS(ReadCNEMC):
         "vmrco": "icos-co-*.nc",
     }
 
-    STATION_REGEX = re.compile("icos-.*-(.*)-.*-.*.nc")  # co2, ch4, co agnostic
+    STATION_REGEX = re.compile(r"icos-.*-(.*)-.*-.*\.nc")  # co2, ch4, co agnostic
 
     DEFAULT_VARS = list(VAR_MAPPING)
 
@@ -165,13 +165,7 @@ class ReadICOS(ReadCNEMC):
             return UngriddedData.from_station_data(stations)
 
     def _read_dataset(self, paths: list[Path]) -> xr.Dataset:
-        return xr.open_mfdataset(
-            sorted(paths),
-            concat_dim="time",
-            combine="nested",
-            parallel=True,
-            decode_cf=True,
-        )
+        return self._open_dataset(tuple(sorted(map(str, paths))))
 
     @classmethod
     def to_stationdata(cls, ds: xr.Dataset, station_name: str) -> StationData:
@@ -196,7 +190,7 @@ class ReadICOS(ReadCNEMC):
         for var in ds.data_vars:
             if var not in cls.PROVIDES_VARIABLES:
                 continue
-            station[var] = ds[var].to_series()
+            station[var] = ds[var].values
             station["var_info"][var] = {"units": ds[var].units}
 
         return station
@@ -505,11 +505,14 @@ class ReadEarlinet(ReadUngriddedBase):
         disp_each = int(num_files * 0.1)
         if disp_each < 1:
             disp_each = 1
+        # index of the next file for which progress is printed
+        next_disp = 0
 
         VAR_IDX = -1
         for i, _file in enumerate(files):
-            if i % disp_each == 0:
+            if i == next_disp:
                 print(f"Reading file {i + 1} of {num_files} ({type(self).__name__})")
+                next_disp += disp_each
             try:
                 stat = self.read_file(
                     _file,
@@ -2,6 +2,7 @@ import fnmatch
 import logging
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from geonum.atmosphere import T0_STD, p0
@@ -166,6 +167,27 @@ class ReadEbasOptions(BrowseDict):
         return d
 
 
+#: reader instance of a worker process, see :func:`_init_worker_reader`
+_WORKER_READER = None
+
+
+def _init_worker_reader(reader_cls, data_id, data_dir, opts):
+    """Initialise the reader used by a worker process of :func:`ReadEbas.read`
+
+    Only the reader settings are transferred once per worker, instead of
+    pickling the whole reader (including its file lists) with every task.
+    """
+    global _WORKER_READER
+    reader = reader_cls(data_id=data_id, data_dir=data_dir)
+    reader._opts = opts
+    _WORKER_READER = reader
+
+
+def _read_file_in_worker(filename, contains):
+    """Read one file with the reader of the current worker process"""
+    return _WORKER_READER._read_file_or_error(filename, contains)
+
+
 class ReadEbas(ReadUngriddedBase):
     """Interface for reading EBAS data
 
@@ -658,14 +680,17 @@ class ReadEbas(ReadUngriddedBase):
         logger.info(f"Retrieving EBAS files for variables\n{vars_to_retrieve}")
         # directory containing NASA Ames files
         filedir = self.file_dir
-        for var in vars_to_retrieve:
+        # station name constraints are the same for all variables, so resolve
+        # them against the database only once
+        try:
+            constraints = self._check_add_station_filter_sqlquery(constraints)
+        except FileNotFoundError:
+            # no station matches, skip all variables
+            vars_to_request = []
+        else:
+            vars_to_request = vars_to_retrieve
+        for var in vars_to_request:
             info = self.get_ebas_var(var)
-            try:
-                constraints = self._check_add_station_filter_sqlquery(constraints)
-            except FileNotFoundError:
-                # skip this variable
-                continue
-
             requests = info.make_sql_requests(**constraints)
             for _var, req in requests.items():
                 filenames = db.get_file_names(req)
@@ -1012,9 +1037,8 @@ class ReadEbas(ReadUngriddedBase):
 
         # write meta information
         tres_code = meta["resolution_code"]
-        try:
-            ts_type = self.TS_TYPE_CODES[tres_code]
-        except KeyError:
+        ts_type = self.TS_TYPE_CODES.get(tres_code)
+        if ts_type is None:
             ival = re.findall(r"\d+", tres_code)[0]
             code = tres_code.split(ival)[-1]
             if code not in self.TS_TYPE_CODES:
@@ -1025,8 +1049,8 @@ class ReadEbas(ReadUngriddedBase):
         data_out["ts_type"] = ts_type
         # altitude of station
         try:
-            altitude = float(meta["station_altitude"].split(" ")[0])
-        except Exception:
+            altitude = float(meta.get("station_altitude", "").split(" ")[0] or "nan")
+        except (AttributeError, ValueError):
             altitude = np.nan
         try:
             meas_height = float(meta["measurement_height"].split(" ")[0])
@@ -1433,12 +1457,15 @@ class ReadEbas(ReadUngriddedBase):
         # store the raw EBAS meta dictionary (who knows what for later ;P )
         # data_out['ebas_meta'] = meta
         data_out["var_info"] = {}
-        for var, colnum in var_cols.items():
+        # gather all matched data columns in one go, column-major, so that
+        # each variable below is a contiguous view into the same block
+        data_block = np.asfortranarray(file.data[:, list(var_cols.values())])
+        for i, (var, colnum) in enumerate(var_cols.items()):
             opts = self.get_read_opts(var)
             data_out["var_info"][var] = {}
 
             _col = file.var_defs[colnum]
-            data = file.data[:, colnum]
+            data = data_block[:, i]
             if opts.freq_from_start_stop_meas:
                 tst = self._check_correct_freq(file, freq_ebas)
                 if tst != freq_ebas:
@@ -1741,7 +1768,13 @@ class ReadEbas(ReadUngriddedBase):
         return vars_to_retrieve + add
 
     def read(
-        self, vars_to_retrieve=None, first_file=None, last_file=None, files=None, **constraints
+        self,
+        vars_to_retrieve=None,
+        first_file=None,
+        last_file=None,
+        files=None,
+        pool=1,
+        **constraints,
     ):
         """Method that reads list of files as instance of :class:`UngriddedData`
 
@@ -1758,6 +1791,9 @@ class ReadEbas(ReadUngriddedBase):
             in the list is used
         files : list
              list of files
+        pool : int
+            number of worker processes used to read the NASA Ames files.
+            Files are read sequentially if 1 (default).
         **constraints
             further reading constraints deviating from default (default
             info for each AEROCOM variable can be found in `ebas_config.ini <
@@ -1797,13 +1833,48 @@ class ReadEbas(ReadUngriddedBase):
         files = files[first_file:last_file]
         files_contain = files_contain[first_file:last_file]
 
-        data = self._read_files(files, vars_to_retrieve, files_contain, constraints)
+        data = self._read_files(files, vars_to_retrieve, files_contain, constraints, pool=pool)
 
         data.clear_meta_no_data()
 
         return data
 
-    def _read_files(self, files, vars_to_retrieve, files_contain, constraints):
+    def _read_file_or_error(self, filename, contains):
+        """Read one file, returning the error instead of raising it
+
+        Returns
+        -------
+        tuple
+            2-element tuple containing the :class:`StationData` (None if
+            reading failed) and the representation of the error (None if
+            reading succeeded)
+        """
+        try:
+            return (self.read_file(filename, vars_to_retrieve=contains), None)
+        except Exception as e:
+            return (None, repr(e))
+
+    def _iter_read_files(self, files, files_contain, pool=1):
+        """Iterate over results of :func:`_read_file_or_error` in file order
+
+        Files are read in ``pool`` worker processes if ``pool`` is larger
+        than 1.
+        """
+        if pool <= 1 or len(files) < 2:
+            for _file, contains in zip(files, files_contain):
+                yield self._read_file_or_error(_file, contains)
+            return
+        chunksize = max(1, len(files) // (4 * pool))
+        with ProcessPoolExecutor(
+            max_workers=pool,
+            initializer=_init_worker_reader,
+            initargs=(type(self), self.data_id, self.data_dir, self._opts),
+        ) as executor:
+            yield from executor.map(
+                _read_file_in_worker, files, files_contain, chunksize=chunksize
+            )
+
+    def _read_files(self, files, vars_to_retrieve, files_contain, constraints, pool=1):
         """Helper that reads list of files into UngriddedData
 
         Note
@@ -1826,67 +1897,92 @@ class ReadEbas(ReadUngriddedBase):
         metadata = data_obj.metadata
         meta_idx = data_obj.meta_idx
 
+        # data array and column indices used in the loop below (the array
+        # reference needs to be updated whenever the array is extended)
+        _data = data_obj._data
+        coord_cols = [
+            data_obj._LATINDEX,
+            data_obj._LONINDEX,
+            data_obj._ALTITUDEINDEX,
+            data_obj._METADATAKEYINDEX,
+        ]
+        timecol = data_obj._TIMEINDEX
+        datacol = data_obj._DATAINDEX
+        varcol = data_obj._VARINDEX
+        flagcol = data_obj._DATAFLAGINDEX
+        errcol = data_obj._DATAERRINDEX
+
         # counter that is updated whenever a new variable appears during read
         # (is used for attr. var_idx in UngriddedData object)
         var_count_glob = -1
+        # unique and order preserving, used to select the variables of each file
+        vars_to_retrieve = tuple(dict.fromkeys(vars_to_retrieve))
         logger.info(f"Reading EBAS data from {self.file_dir}")
         num_files = len(files)
-        for i in tqdm(range(num_files), disable=None):
-            _file = files[i]
-            contains = files_contain[i]
-            try:
-                station_data = self.read_file(_file, vars_to_retrieve=contains)
-
-            except (
-                NotInFileError,
-                EbasFileError,
-                TemporalResolutionError,
-                TemporalSamplingError,
-            ) as e:
+        results = self._iter_read_files(files, files_contain, pool)
+        for _file, (station_data, err) in tqdm(zip(files, results), total=num_files, disable=None):
+            if station_data is None:
                 self.files_failed.append(_file)
-                self.logger.warning(
-                    f"Skipping reading of EBAS NASA Ames file: {_file}. Reason: {repr(e)}"
-                )
-                continue
-            except Exception as e:
-                self.files_failed.append(_file)
-                logger.warning(
-                    f"Skipping reading of EBAS NASA Ames file: {_file}. Reason: {repr(e)}"
-                )
+                logger.warning(f"Skipping reading of EBAS NASA Ames file: {_file}. Reason: {err}")
                 continue
 
             # Fill the metatdata dict
             # the location in the data set is time step dependent!
             # use the lat location here since we have to choose one location
             # in the time series plot
-            metadata[meta_key] = {}
-            metadata[meta_key].update(station_data.get_meta(add_none_vals=True))
+            # get_meta returns a new dict which is used as is
+            meta = station_data.get_meta(add_none_vals=True)
 
             if "station_name_orig" in station_data:
-                metadata[meta_key]["station_name_orig"] = station_data["station_name_orig"]
+                meta["station_name_orig"] = station_data["station_name_orig"]
 
-            metadata[meta_key]["data_revision"] = self.data_revision
-            metadata[meta_key]["var_info"] = {}
+            meta["data_revision"] = self.data_revision
+            meta["var_info"] = {}
+            metadata[meta_key] = meta
             # this is a list with indices of this station for each variable
             # not sure yet, if we really need that or if it speeds up things
             meta_idx[meta_key] = {}
 
-            num_times = len(station_data["dtime"])
+            # look up the per-file attributes once, they are used for each
+            # variable below
+            dtime = station_data["dtime"]
+            var_info = station_data["var_info"]
+            data_flagged = station_data.data_flagged
+            data_err = station_data.data_err
+
+            num_times = len(dtime)
 
-            contains_vars = list(station_data.var_info)
-            # access array containing time stamps
+            # access array containing time stamps (datetime64[s]) as float
+            # seconds, reinterpreting the buffer rather than casting each value
             # TODO: check using index instead (even though not a problem here
             # since all Aerocom data files are of type timeseries)
-            times = np.float64(station_data["dtime"])
+            times = np.asarray(dtime, dtype="datetime64[s]").view(np.int64).astype(np.float64)
 
-            append_vars = [x for x in np.intersect1d(vars_to_retrieve, contains_vars)]
+            append_vars = [var for var in vars_to_retrieve if var in var_info]
 
             totnum = num_times * len(append_vars)
 
             # check if size of data object needs to be extended
-            if (idx + totnum) >= data_obj._ROWNO:
-                # if totnum < data_obj._CHUNKSIZE, then the latter is used
+            if (idx + totnum) >= len(_data):
+                # add_chunk at least doubles the array
                 data_obj.add_chunk(totnum)
+                _data = data_obj._data
+
+            # write common meta info for this station for all variables at
+            # once (data lon, lat and altitude are set to station locations)
+            _data[idx : idx + totnum, coord_cols] = (
+                station_data["latitude"],
+                station_data["longitude"],
+                station_data["altitude"],
+                meta_key,
+            )
+            # all variables of a file share the same time stamps
+            _data[idx : idx + totnum, timecol] = np.tile(times, len(append_vars))
+            # row indices of this file, the entry of each variable in meta_idx
+            # is a view into this array
+            file_rows = np.arange(idx, idx + totnum)
+            # variable index of each variable in append_vars
+            file_var_idx = []
 
             for var_count, var in enumerate(append_vars):
                 # data values
@@ -1902,39 +1998,26 @@ class ReadEbas(ReadUngriddedBase):
                     data_obj.var_idx[var] = var_idx
                 else:
                     var_idx = data_obj.var_idx[var]
-
-                # write common meta info for this station (data lon, lat and
-                # altitude are set to station locations)
-                data_obj._data[start:stop, data_obj._LATINDEX] = station_data["latitude"]
-                data_obj._data[start:stop, data_obj._LONINDEX] = station_data["longitude"]
-                data_obj._data[start:stop, data_obj._ALTITUDEINDEX] = station_data["altitude"]
-                data_obj._data[start:stop, data_obj._METADATAKEYINDEX] = meta_key
+                file_var_idx.append(var_idx)
 
                 # write data to data object
-                data_obj._data[start:stop, data_obj._TIMEINDEX] = times
-
-                data_obj._data[start:stop, data_obj._DATAINDEX] = values
-
-                data_obj._data[start:stop, data_obj._VARINDEX] = var_idx
+                _data[start:stop, datacol] = values
 
-                if var in station_data.data_flagged:
-                    invalid = station_data.data_flagged[var]
-                    data_obj._data[start:stop, data_obj._DATAFLAGINDEX] = invalid
-                if var in station_data.data_err:
-                    errs = station_data.data_err[var]
-                    data_obj._data[start:stop, data_obj._DATAERRINDEX] = errs
+                if var in data_flagged:
+                    _data[start:stop, flagcol] = data_flagged[var]
+                if var in data_err:
+                    _data[start:stop, errcol] = data_err[var]
 
-                var_info = station_data["var_info"][var]
-                metadata[meta_key]["var_info"][var] = {}
-                metadata[meta_key]["var_info"][var].update(var_info)
-                meta_idx[meta_key][var] = np.arange(start, stop)
+                meta["var_info"][var] = dict(var_info[var])
+                meta_idx[meta_key][var] = file_rows[start - idx : stop - idx]
 
-            metadata[meta_key]["variables"] = append_vars
+            _data[idx : idx + totnum, varcol] = np.repeat(file_var_idx, num_times)
+            meta["variables"] = append_vars
             idx += totnum
             meta_key += 1
 
         # shorten data_obj._data to the right number of points
-        data_obj._data = data_obj._data[:idx]
+        data_obj._data = _data[:idx]
 
         num_failed = len(self.files_failed)
         if num_failed > 0:
@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import fnmatch
 import logging
+import math
 import os
+import re
 from datetime import datetime
+from operator import itemgetter
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -23,6 +26,7 @@ from pyaerocom.exceptions import (
 )
 from pyaerocom.geodesy import get_country_info_coords
 from pyaerocom.helpers import (
+    NUM_KEYS_META,
     isnumeric,
     merge_station_data,
     same_meta_dict,
@@ -40,6 +44,13 @@ from .tstype import TsType
 
 logger = logging.getLogger(__name__)
 
+#: default time interval for conversion to :class:`StationData`
+_DEFAULT_START = np.datetime64("1970-01-01", "s")
+_DEFAULT_STOP = np.datetime64("2200-01-01", "s")
+
+#: placeholder for meta keys that are not set in a metadata block
+_MISSING = object()
+
 
 class UngriddedData:
     """Class representing point-cloud data (ungridded)
@@ -325,16 +336,22 @@ class UngriddedData:
                     if not len(times) == len(values):
                         raise ValueError
 
-                times = np.asarray(
-                    [
-                        (
-                            np.datetime64(x.replace(tzinfo=None), "s")
-                            if isinstance(x, datetime)
-                            else np.datetime64(x, "s")
-                        )
-                        for x in times
-                    ]
-                )
+                if isinstance(times, pd.DatetimeIndex) and times.tz is None:
+                    times = times.values
+                if isinstance(times, np.ndarray) and times.dtype.kind == "M":
+                    # convert whole array at once (e.g. datetime64[ns] arrays)
+                    times = times.astype("datetime64[s]")
+                else:
+                    times = np.asarray(
+                        [
+                            (
+                                np.datetime64(x.replace(tzinfo=None), "s")
+                                if isinstance(x, datetime)
+                                else np.datetime64(x, "s")
+                            )
+                            for x in times
+                        ]
+                    )
                 times = np.float64(times)
 
                 num_times = len(times)
@@ -471,9 +488,19 @@ class UngriddedData:
         """
         self._is_vertical_profile = value
 
-    def copy(self):
+    def copy(self, deep=True):
         """Make a copy of this object
 
+        Parameters
+        ----------
+        deep : bool
+            if True (default), the metadata dictionaries (:attr:`metadata`,
+            :attr:`meta_idx`, :attr:`var_idx`, :attr:`filter_hist`) are deep
+            copied. If False, only the top level dictionaries are copied and
+            the entries (e.g. metadata blocks) are shared with this object,
+            which is much faster for many stations, but these must then not
+            be modified in place. The data array is copied in both cases.
+
         Returns
         -------
         UngriddedData
@@ -485,15 +512,30 @@ class UngriddedData:
             if copy is too big to fit into memory together with existing
             instance
         """
+        new = self._copy_shared_data(deep)
+        new._data = np.copy(self._data)
+        return new
+
+    def _copy_shared_data(self, deep=True):
+        """Make a copy of this object that shares the data array with it
+
+        Used where the data array of the copy is replaced right away. See
+        :func:`copy` for input args.
+        """
         from copy import deepcopy
 
-        new = UngriddedData()
-        new._data = np.copy(self._data)
-        new.metadata = deepcopy(self.metadata)
+        copier = deepcopy if deep else dict
+
+        # do not allocate a default sized data array that is replaced anyways
+        new = UngriddedData(num_points=0)
+        new._chunksize = self._chunksize
+        new._index = dict(self._index)
+        new._data = self._data
+        new.metadata = copier(self.metadata)
         new.data_revision = self.data_revision
-        new.meta_idx = deepcopy(self.meta_idx)
-        new.var_idx = deepcopy(self.var_idx)
-        new.filter_hist = deepcopy(self.filter_hist)
+        new.meta_idx = copier(self.meta_idx)
+        new.var_idx = copier(self.var_idx)
+        new.filter_hist = copier(self.filter_hist)
         return new
 
     @property
@@ -504,25 +546,14 @@ class UngriddedData:
     @property
     def contains_datasets(self):
         """List of all datasets in this object"""
-        datasets = []
-        for info in self.metadata.values():
-            ds = info["data_id"]
-            if ds not in datasets:
-                datasets.append(ds)
-        return datasets
+        return list(dict.fromkeys(info["data_id"] for info in self.metadata.values()))
 
     @property
     def contains_instruments(self):
         """List of all instruments in this object"""
-        instruments = []
-        for info in self.metadata.values():
-            try:
-                instr = info["instrument_name"]
-                if instr is not None and instr not in instruments:
-                    instruments.append(instr)
-            except Exception:
-                pass
-        return instruments
+        instruments = dict.fromkeys(info.get("instrument_name") for info in self.metadata.values())
+        instruments.pop(None, None)
+        return list(instruments)
 
     @property
     def shape(self):
@@ -549,13 +580,7 @@ class UngriddedData:
     @property
     def longitude(self):
         """Longitudes of stations"""
-        vals = []
-        for v in self.metadata.values():
-            try:
-                vals.append(v["longitude"])
-            except Exception:
-                vals.append(np.nan)
-        return vals
+        return [v.get("longitude", np.nan) for v in self.metadata.values()]
 
     @longitude.setter
     def longitude(self, value):
@@ -564,13 +589,7 @@ class UngriddedData:
     @property
     def latitude(self):
         """Latitudes of stations"""
-        vals = []
-        for v in self.metadata.values():
-            try:
-                vals.append(v["latitude"])
-            except Exception:
-                vals.append(np.nan)
-        return vals
+        return [v.get("latitude", np.nan) for v in self.metadata.values()]
 
     @latitude.setter
     def latitude(self, value):
@@ -579,13 +598,7 @@ class UngriddedData:
     @property
     def altitude(self):
         """Altitudes of stations"""
-        vals = []
-        for v in self.metadata.values():
-            try:
-                vals.append(v["altitude"])
-            except Exception:
-                vals.append(np.nan)
-        return vals
+        return [v.get("altitude", np.nan) for v in self.metadata.values()]
 
     @altitude.setter
     def altitude(self, value):
@@ -594,13 +607,7 @@ class UngriddedData:
     @property
     def station_name(self):
         """Latitudes of data"""
-        vals = []
-        for v in self.metadata.values():
-            try:
-                vals.append(v["station_name"])
-            except Exception:
-                vals.append(np.nan)
-        return vals
+        return [v.get("station_name", np.nan) for v in self.metadata.values()]
 
     @station_name.setter
     def station_name(self, value):
@@ -663,12 +670,18 @@ class UngriddedData:
         size : :obj:`int`, optional
             number of additional rows. If None (default) or smaller than
             minimum chunksize specified in attribute ``_CHUNKSIZE``, then the
-            latter is used.
+            latter is used. The array grows at least by its current number of
+            rows (i.e. doubles), so that filling it through repeated calls
+            only requires a logarithmic number of reallocations.
         """
         if size is None or size < self._chunksize:
             size = self._chunksize
-        chunk = np.full([size, self._COLNO], np.nan)
-        self._data = np.append(self._data, chunk, axis=0)
+        rowno = self._ROWNO
+        size = max(size, rowno)
+        data = np.empty([rowno + size, self._COLNO])
+        data[:rowno] = self._data
+        data[rowno:] = np.nan
+        self._data = data
         logger.info(f"adding chunk, new array size ({self._data.shape})")
 
     def _find_station_indices_wildcards(self, station_str):
@@ -690,10 +703,8 @@ class UngriddedData:
         StationNotFoundError
             if no such station exists in this data object
         """
-        idx = []
-        for i, meta in self.metadata.items():
-            if fnmatch.fnmatch(meta["station_name"], station_str):
-                idx.append(i)
+        match = _wildcard_matcher(station_str)
+        idx = [i for i, meta in self.metadata.items() if match(meta["station_name"])]
         if len(idx) == 0:
             raise StationNotFoundError(
                 f"No station available in UngriddedData that matches pattern {station_str}"
@@ -729,6 +740,23 @@ class UngriddedData:
             )
         return idx
 
+    def _station_name_index(self):
+        """Mapping of station names to the metadata indices of each station
+
+        Computed in one pass over :attr:`metadata`, so that looking up many
+        stations by name does not require a search through all metadata
+        blocks for each name (cf. :func:`_find_station_indices`).
+
+        Returns
+        -------
+        dict
+            keys are station names, values are lists of metadata indices
+        """
+        index = {}
+        for i, meta in self.metadata.items():
+            index.setdefault(meta["station_name"], []).append(i)
+        return index
+
     def _get_stat_coords(self):
         meta_idx = []
         coords = []
@@ -909,8 +937,7 @@ class UngriddedData:
             if len(vars_to_convert) == 0:
                 raise DataCoverageError("UngriddedData object does not contain any variables")
         if start is None and stop is None:
-            start = pd.Timestamp("1970")
-            stop = pd.Timestamp("2200")
+            start, stop = _DEFAULT_START, _DEFAULT_STOP
         else:
             start, stop = start_stop(start, stop)
 
@@ -1058,69 +1085,82 @@ class UngriddedData:
                 raise VarNotAvailableError("Metablock does not contain variable information")
             vars_avail = meta["variables"]
 
+        protected = frozenset(sd.PROTECTED_KEYS)
         for key in self.STANDARD_META_KEYS + add_meta_keys:
-            if key in sd.PROTECTED_KEYS:
+            if key in protected:
                 logger.warning(f"skipping protected key: {key}")
                 continue
-            try:
+            if key in meta:
                 sd[key] = meta[key]
-            except KeyError:
-                pass
 
-        try:
+        if "ts_type" in meta:
             sd["ts_type_src"] = meta["ts_type"]
-        except KeyError:
-            pass
 
         # assign station coordinates explicitely
         for ck in sd.STANDARD_COORD_KEYS:
-            try:
+            if ck in meta:
                 sd.station_coords[ck] = meta[ck]
-            except KeyError:
-                pass
         # if no input variables are provided, use the ones that are available
         # for this metadata block
         if vars_to_convert is None:
             vars_to_convert = vars_avail
 
-        # find overlapping variables (ignore all other ones)
-        vars_avail = np.intersect1d(vars_to_convert, vars_avail)
-        if not len(vars_avail) >= 1:
+        # find overlapping variables (ignore all other ones), sorted by name
+        # like np.intersect1d, which is slow for these short lists
+        vars_avail = sorted(set(vars_to_convert).intersection(vars_avail))
+        if not vars_avail:
             raise VarNotAvailableError(
                 "None of the input variables matches, or station does not contain data."
             )
         # init helper boolean that is set to True if valid data can be found
         # for at least one of the input variables
         FOUND_ONE = False
+        # time interval in seconds since epoch (i.e. in units of the time
+        # column), so that time stamps only need to be converted to
+        # datetime64 once they are selected
+        tstart = None if start is None else _datetime64_to_seconds(start)
+        tstop = None if stop is None else _datetime64_to_seconds(stop)
         for var in vars_avail:
             # get indices of this variable
-            var_idx = self.meta_idx[meta_idx][var]
+            var_idx = np.asarray(self.meta_idx[meta_idx][var], dtype=np.intp)
 
             # vector of timestamps corresponding to this variable
-            dtime = self._data[var_idx, self._TIMEINDEX].astype("datetime64[s]")
-
-            # get subset
-            subset = self._data[var_idx]
+            times = self._data[var_idx, self._TIMEINDEX]
 
             # make sure to extract only valid timestamps
-            if start is None:
-                start = dtime.min()
-            if stop is None:
-                stop = dtime.max()
-
-            # create access mask for valid time stamps
-            tmask = np.logical_and(dtime >= start, dtime <= stop)
+            if tstart is None:
+                tstart = times.min()
+            if tstop is None:
+                tstop = times.max()
+
+            # select valid time stamps: time stamps are usually sorted, then
+            # the interval can be found by bisection, else create access mask
+            is_sorted = np.all(times[1:] >= times[:-1])
+            if is_sorted:
+                tsel = slice(
+                    np.searchsorted(times, tstart, "left"), np.searchsorted(times, tstop, "right")
+                )
+            else:
+                tsel = np.logical_and(times >= tstart, times <= tstop)
+            var_idx = var_idx[tsel]
 
             # make sure there is some valid data
-            if tmask.sum() == 0:
+            if len(var_idx) == 0:
                 logger.debug(
                     f"Ignoring station {sd['station_name']}, var {var} ({sd['data_id']}): "
                     f"no data available in specified time interval {start} - {stop}"
                 )
                 continue
 
-            dtime = dtime[tmask]
-            subset = subset[tmask]
+            # gather the rows within the time interval in one go (rather than
+            # all rows of this variable first and then applying the mask)
+            dtime = times[tsel].astype("datetime64[s]")
+            subset = self._data[var_idx]
+            if not is_sorted and not np.all(dtime[1:] >= dtime[:-1]):
+                # sort all columns (not only the data values) by time
+                order = np.argsort(dtime, kind="stable")
+                dtime = dtime[order]
+                subset = subset[order]
 
             vals = subset[:, self._DATAINDEX]
             if np.all(np.isnan(vals)):
@@ -1134,8 +1174,6 @@ class UngriddedData:
             altitude = subset[:, self._DATAHEIGHTINDEX]
 
             data = pd.Series(vals, dtime)
-            if not data.index.is_monotonic_increasing:
-                data = data.sort_index()
             if any(~np.isnan(vals_err)):
                 sd.data_err[var] = vals_err
             if any(~np.isnan(flagged)):
@@ -1158,10 +1196,8 @@ class UngriddedData:
             if var in vi:
                 sd.var_info[var].update(vi[var])
 
-            if len(data.index) == len(data.index.unique()):
-                sd.var_info[var]["overlap"] = False
-            else:
-                sd.var_info[var]["overlap"] = True
+            # time stamps are sorted, so duplicates are adjacent
+            sd.var_info[var]["overlap"] = bool(np.any(dtime[1:] == dtime[:-1]))
         if not FOUND_ONE:
             raise DataCoverageError(
                 f"Could not retrieve any valid data for station {sd['station_name']} "
@@ -1186,19 +1222,16 @@ class UngriddedData:
             return [i for i in range(len(self.metadata)) if i not in ignore_index]
 
         # by station name and ignore certation stations
-        _iter = []
         if isinstance(ignore_index, str):
             ignore_index = [ignore_index]
         if not isinstance(ignore_index, list):
             raise ValueError("Invalid input for ignore_index, need str or list")
-        for stat_name in self.unique_station_names:
-            ok = True
-            for name_or_pattern in ignore_index:
-                if fnmatch.fnmatch(stat_name, name_or_pattern):
-                    ok = False
-            if ok:
-                _iter.append(stat_name)
-        return _iter
+        ignore = [_wildcard_matcher(name_or_pattern) for name_or_pattern in ignore_index]
+        return [
+            stat_name
+            for stat_name in self.unique_station_names
+            if not any(match(stat_name) for match in ignore)
+        ]
 
     def to_station_data_all(
         self,
@@ -1235,8 +1268,8 @@ class UngriddedData:
             matches if applicable), else, iter over metadata index
         **kwargs
             additional keyword args passed to :func:`to_station_data` (e.g.
-            `merge_if_multi, merge_pref_attr, merge_sort_by_largest,
-            insert_nans`)
+            `merge_pref_attr, merge_sort_by_largest, insert_nans`). Note
+            that `merge_if_multi` is always True here.
 
         Returns
         -------
@@ -1252,10 +1285,13 @@ class UngriddedData:
         out_data = {"stats": [], "station_name": [], "latitude": [], "failed": [], "longitude": []}
 
         _iter = self._generate_station_index(by_station_name, ignore_index)
+        if by_station_name:
+            # resolve all station names at once rather than per station
+            station_index = self._station_name_index()
         for idx in _iter:
             try:
                 data = self.to_station_data(
-                    idx,
+                    station_index[idx] if by_station_name else idx,
                     vars_to_convert,
                     start,
                     stop,
@@ -1297,21 +1333,30 @@ class UngriddedData:
         """
         if isinstance(variables, str):
             variables = [variables]
-        all_stations = self.to_station_data_all(variables, start, stop, freq=ts_type, **kwargs)
+        all_stations = self.to_station_data_all(variables, start, stop, freq=ts_type, **kwargs)[
+            "stats"
+        ]
+        # the variables of a station may have different time axes, so the
+        # number of points is counted per variable (missing variables are
+        # filled with NaN for the length of the station time axis)
+        sizes = {var: [] for var in variables}
+        for stat_data in all_stations:
+            num_points = len(stat_data.dtime)
+            for var in variables:
+                sizes[var].append(len(stat_data[var]) if var in stat_data else num_points)
         result = {}
         num_stats = {}
         for var in variables:
-            result[var] = []
+            values = np.full(sum(sizes[var]), np.nan)
             num_stats[var] = 0
-        for stat_data in all_stations:
-            if stat_data is not None:
-                num_points = len(stat_data.dtime)
-                for var in variables:
-                    if var in stat_data:
-                        num_stats[var] += 1
-                        result[var].extend(stat_data[var])
-                    else:
-                        result[var].extend([np.nan] * num_points)
+            offset = 0
+            for stat_data, num_points in zip(all_stations, sizes[var]):
+                # data of missing variables is already NaN
+                if var in stat_data:
+                    num_stats[var] += 1
+                    values[offset : offset + num_points] = stat_data[var]
+                offset += num_points
+            result[var] = values
         result["num_stats"] = num_stats
         return result
 
@@ -1393,7 +1438,8 @@ class UngriddedData:
             if metakey not in meta:
                 return False
             neg = metakey in negate
-            match = in_range(meta[metakey], filterval[0], filterval[1])
+            low, high = filterval
+            match = low <= meta[metakey] <= high
             if (neg and match) or (not neg and not match):
                 return False
 
@@ -1427,11 +1473,11 @@ class UngriddedData:
             - dict: in-list match filters for metakeys \
               (e.g. dict['station_name'] = ['stat1', 'stat2', 'stat3'])
             - dict: in-range dictionary for metakeys \
-              (e.g. dict['longitude'] = [-30, 30])
+              (e.g. dict['longitude'] = (-30, 30))
 
         """
         # initiate filters that are checked
-        valid_keys = list(self.metadata[self.first_meta_idx])
+        valid_keys = self.metadata[self.first_meta_idx].keys()
         str_f = {}
         list_f = {}
         range_f = {}
@@ -1440,7 +1486,7 @@ class UngriddedData:
             if key not in valid_keys:
                 raise OSError(
                     f"Invalid input parameter for filtering: {key}. "
-                    f"Please choose from {valid_keys}"
+                    f"Please choose from {list(valid_keys)}"
                 )
 
             if isinstance(val, str):
@@ -1455,7 +1501,7 @@ class UngriddedData:
                         low, high = float(val[0]), float(val[1])
                         if not low < high:
                             raise ValueError("First entry needs to be smaller than 2nd")
-                        range_f[key] = [low, high]
+                        range_f[key] = (low, high)
                     except Exception:
                         list_f[key] = val
                 else:
@@ -1513,13 +1559,11 @@ class UngriddedData:
         if unit is None:
             unit = const.VARS[var_name]["units"]
 
-        units = []
+        units = set()
         for i, meta in self.metadata.items():
             if var_name in meta["var_info"]:
                 try:
-                    u = meta["var_info"][var_name]["units"]
-                    if u not in units:
-                        units.append(u)
+                    units.add(meta["var_info"][var_name]["units"])
                 except KeyError:
                     add_str = ""
                     if "unit" in meta["var_info"][var_name]:
@@ -1629,31 +1673,22 @@ class UngriddedData:
         if high is None:
             high = const.VARS[var_name].maximum
             logger.info(f"Setting {var_name} outlier upper lim: {high:.2f}")
-        var_idx = new.var_idx[var_name]
-        var_mask = new._data[:, new._VARINDEX] == var_idx
-
-        all_data = new._data[:, new._DATAINDEX]
-        invalid_mask = np.logical_or(all_data < low, all_data > high)
-
-        mask = invalid_mask * var_mask
-        invalid_vals = new._data[mask, new._DATAINDEX]
-        new._data[mask, new._DATAINDEX] = np.nan
+        rows = _outlier_rows(new._data, new.var_idx[var_name], low, high)
 
         if move_to_trash:
             # check if trash is empty and put outliers into trash
-            trash = new._data[mask, new._TRASHINDEX]
-            if np.isnan(trash).sum() == len(trash):  # trash is empty
-                new._data[mask, new._TRASHINDEX] = invalid_vals
-            else:
+            if not np.isnan(new._data[rows, new._TRASHINDEX]).all():
                 raise ValueError(
                     "Trash is not empty for some of the datapoints. "
                     "Please empty trash first using method "
                     ":func:`empty_trash` or deactivate input arg "
                     ":attr:`move_to_trash`"
                 )
+            new._data[rows, new._TRASHINDEX] = new._data[rows, new._DATAINDEX]
+        new._data[rows, new._DATAINDEX] = np.nan
 
         new._add_to_filter_history(
-            f"Removed {len(invalid_vals)} outliers from {var_name} data "
+            f"Removed {len(rows)} outliers from {var_name} data "
             f"(range: {low}-{high}, in trash: {move_to_trash})"
         )
         return new
@@ -1661,15 +1696,20 @@ class UngriddedData:
     def _add_to_filter_history(self, info):
         """Add info to :attr:`filter_hist`
 
-        Key is current system time string
+        Key is current system time as integer (YYYYmmddHHMMSS). If several
+        filters are applied within one second, the key is incremented, so
+        that no entry is overwritten and the latest entry has the largest
+        key.
 
         Parameter
         ---------
         info
             information to be appended to filter history
         """
-        time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        self.filter_hist[int(time_str)] = info
+        key = int(datetime.now().strftime("%Y%m%d%H%M%S"))
+        if self.filter_hist:
+            key = max(key, max(self.filter_hist) + 1)
+        self.filter_hist[key] = info
 
     def empty_trash(self):
         """Set all values in trash column to NaN"""
@@ -1687,12 +1727,14 @@ class UngriddedData:
             are accessible.
         """
         d = {"station_name": [], "latitude": [], "longitude": [], "altitude": []}
+        coord_names = const.STANDARD_COORD_NAMES
+        stats_found = set()
 
         for i, meta in self.metadata.items():
             if "station_name" not in meta:
                 logger.debug(f"Skipping meta-block {i}: station_name is not defined")
                 continue
-            elif not all(name in meta for name in const.STANDARD_COORD_NAMES):
+            elif not all(name in meta for name in coord_names):
                 logger.debug(
                     f"Skipping meta-block {i} (station {meta['station_name']}): "
                     f"one or more of the coordinates is not defined"
@@ -1701,13 +1743,42 @@ class UngriddedData:
 
             stat = meta["station_name"]
 
-            if stat in d["station_name"]:
+            if stat in stats_found:
                 continue
+            stats_found.add(stat)
             d["station_name"].append(stat)
-            for k in const.STANDARD_COORD_NAMES:
+            for k in coord_names:
                 d[k].append(meta[k])
         return d
 
+    def _coordinates_with_data(self, var_name):
+        """Coordinates of all stations that have valid data of a variable
+
+        Parameters
+        ----------
+        var_name : str
+            variable name
+
+        Returns
+        -------
+        tuple
+            lists of longitudes and latitudes, one entry per station name
+            (coordinates of first metadata block of each station)
+        """
+        lons, lats = [], []
+        stations_found = set()
+        for meta_idx, meta in self.metadata.items():
+            name = meta["station_name"]
+            rows = self.meta_idx.get(meta_idx, {}).get(var_name)
+            if name in stations_found or rows is None or len(rows) == 0:
+                continue
+            if not np.isfinite(self._data[rows, self._DATAINDEX]).any():
+                continue
+            stations_found.add(name)
+            lons.append(meta["longitude"])
+            lats.append(meta["latitude"])
+        return lons, lats
+
     def _find_meta_matches(self, negate=None, *filters):
         """Find meta matches for input attributes
 
@@ -1725,7 +1796,7 @@ class UngriddedData:
 
         Returns
         -------
-        tuple
+        list
             list of metadata indices that match input filter
         """
         if negate is None:
@@ -1735,22 +1806,22 @@ class UngriddedData:
         elif not isinstance(negate, list):
             raise ValueError(f"Invalid input for negate {negate}, need list or str or None")
         meta_matches = []
-        totnum = 0
+        # the filter match only depends on the values of the filtered keys, so
+        # check each distinct combination of values only once
+        filter_keys = [key for filt in filters for key in filt]
+        results = {}
         for meta_idx, meta in self.metadata.items():
-            if self._check_filter_match(meta, negate, *filters):
+            values = tuple(meta.get(key, _MISSING) for key in filter_keys)
+            try:
+                match = results[values]
+            except KeyError:
+                match = results[values] = self._check_filter_match(meta, negate, *filters)
+            except TypeError:  # unhashable meta values
+                match = self._check_filter_match(meta, negate, *filters)
+            if match:
                 meta_matches.append(meta_idx)
-                for var in meta["var_info"]:
-                    if var in self.ALLOWED_VERT_COORD_TYPES:
-                        continue  # altitude is not actually a variable but is stored in var_info like one
-                    try:
-                        totnum += len(self.meta_idx[meta_idx][var])
-                    except KeyError:
-                        logger.debug(
-                            f"Ignoring variable {var} in meta block {meta_idx} "
-                            f"since no data could be found"
-                        )
 
-        return (meta_matches, totnum)
+        return meta_matches
 
     def filter_altitude(self, alt_range):
         """Filter altitude range
@@ -1818,25 +1889,20 @@ class UngriddedData:
             )
 
         # 1. find matches -> list of meta indices that are in region
-        # 2. Get total number of datapoints -> defines shape of output UngriddedData
-        # 3. Create
+        # 2. Create
 
         mask = load_region_mask_xr(region_id)
 
         meta_matches = []
-        totnum = 0
         for meta_idx, meta in self.metadata.items():
             lon, lat = meta["longitude"], meta["latitude"]
 
             mask_val = get_mask_value(lat, lon, mask)
             if mask_val >= 1:  # coordinate is in mask
                 meta_matches.append(meta_idx)
-                for var in meta["var_info"]:
-                    totnum += len(self.meta_idx[meta_idx][var])
 
-        new = self._new_from_meta_blocks(meta_matches, totnum)
-        time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        new.filter_hist[int(time_str)] = f"Applied mask {region_id}"
+        new = self._new_from_meta_blocks(meta_matches)
+        new._add_to_filter_history(f"Applied mask {region_id}")
         new._check_index()
         return new
 
@@ -1936,7 +2002,6 @@ class UngriddedData:
         :param yrange: y range (min/max included) in the projection plane
         """
         meta_matches = []
-        totnum = 0
         for meta_idx, meta in self.metadata.items():
             lon = meta["longitude"]
             lat = meta["latitude"]
@@ -1947,21 +2012,11 @@ class UngriddedData:
 
             if match_x and match_y:
                 meta_matches.append(meta_idx)
-                for var in meta["var_info"]:
-                    if var in self.ALLOWED_VERT_COORD_TYPES:
-                        continue  # altitude is not actually a variable but is stored in var_info like one
-                    try:
-                        totnum += len(self.meta_idx[meta_idx][var])
-                    except KeyError:
-                        logger.debug(
-                            f"Ignoring variable {var} in meta block {meta_idx} "
-                            f"since no data could be found"
-                        )
 
         if len(meta_matches) == len(self.metadata):
             logger.info("filter_by_projection result in unchanged data object")
             return self
-        new = self._new_from_meta_blocks(meta_matches, totnum)
+        new = self._new_from_meta_blocks(meta_matches)
         return new
 
     def filter_by_meta(self, negate=None, **filter_attributes):
@@ -2013,51 +2068,59 @@ class UngriddedData:
         filters = self._init_meta_filters(**filter_attributes)
 
         # find all metadata blocks that match the filters
-        meta_matches, totnum_new = self._find_meta_matches(
+        meta_matches = self._find_meta_matches(
             negate,
             *filters,
         )
         if len(meta_matches) == len(self.metadata):
             logger.info(f"Input filters {filter_attributes} result in unchanged data object")
             return self
-        new = self._new_from_meta_blocks(meta_matches, totnum_new)
-        time_str = datetime.now().strftime("%Y%m%d%H%M%S")
-        new.filter_hist[int(time_str)] = filter_attributes
+        new = self._new_from_meta_blocks(meta_matches)
+        new._add_to_filter_history(filter_attributes)
         return new
 
-    def _new_from_meta_blocks(self, meta_indices, totnum_new):
-        # make a new empty object with the right size (totnum_new)
-
-        new = UngriddedData(num_points=totnum_new)
+    def _new_from_meta_blocks(self, meta_indices):
+        new = UngriddedData(num_points=0)
+        # the data rows are copied including additional columns (add_cols)
+        new._index = dict(self._index)
 
-        meta_idx_new = 0.0
+        # collect the data rows of all variables of all metadata blocks to
+        # extract them with a single gather
+        indices = []
+        num_rows = []
         data_idx_new = 0
-
-        # loop over old meta_idx and extract data and create new meta_idx in
-        # output data object
-        for meta_idx in meta_indices:
+        for meta_idx_new, meta_idx in enumerate(meta_indices):
+            meta_idx_new = float(meta_idx_new)
             meta = self.metadata[meta_idx]
             new.metadata[meta_idx_new] = meta
             new.meta_idx[meta_idx_new] = {}
+            var_indices = self.meta_idx.get(meta_idx, {})
+            block_start = data_idx_new
             for var in meta["var_info"]:
                 if var in self.ALLOWED_VERT_COORD_TYPES:
+                    continue  # altitude is not actually a variable but is stored in var_info like one
+                if var not in var_indices:
+                    logger.debug(
+                        f"Ignoring variable {var} in meta block {meta_idx} "
+                        f"since no data could be found"
+                    )
                     continue
-                indices = self.meta_idx[meta_idx][var]
-                totnum = len(indices)
-
-                stop = data_idx_new + totnum
-
-                new._data[data_idx_new:stop, :] = self._data[indices, :]
-                new._data[data_idx_new:stop, new._METADATAKEYINDEX] = meta_idx_new
+                var_rows = np.asarray(var_indices[var], dtype=int)
+                stop = data_idx_new + len(var_rows)
+                indices.append(var_rows)
                 new.meta_idx[meta_idx_new][var] = np.arange(data_idx_new, stop)
                 new.var_idx[var] = self.var_idx[var]
-                data_idx_new += totnum
+                data_idx_new = stop
+            num_rows.append(data_idx_new - block_start)
 
-            meta_idx_new += 1
-
-        if meta_idx_new == 0 or data_idx_new == 0:
+        if not meta_indices or data_idx_new == 0:
             raise DataExtractionError("Filtering results in empty data object")
-        new._data = new._data[:data_idx_new]
+        new._data = self._data[np.concatenate(indices)]
+        # same as UngriddedData(num_points=data_idx_new), i.e. the array is
+        # allocated at its final size right away and grows by the number of
+        # extracted rows if extended later on
+        new._chunksize = data_idx_new
+        new._data[:, new._METADATAKEYINDEX] = np.repeat(np.arange(len(num_rows)), num_rows)
 
         # write history of filtering applied
         new.filter_hist.update(self.filter_hist)
@@ -2255,23 +2318,20 @@ class UngriddedData:
         determine single locations"""
 
         # multiply lons with 10 ** (three times the needed) precision and add the lats muliplied with 1E(precision) to it
-        self.coded_loc = self._data[:, self._LONINDEX] * 10 ** (3 * self._LOCATION_PRECISION) + (
-            self._data[:, self._LATINDEX] + self._LAT_OFFSET
-        ) * (10**self._LOCATION_PRECISION)
+        scale = 10**self._LOCATION_PRECISION
+        self.coded_loc = (
+            self._data[:, self._LONINDEX] * scale**3
+            + (self._data[:, self._LATINDEX] + self._LAT_OFFSET) * scale
+        )
         return self.coded_loc
 
     def decode_lat_lon_from_float(self):
         """method to decode lat and lon from a single number calculated by code_lat_lon_in_float"""
 
-        lons = (
-            np.trunc(self.coded_loc / 10 ** (2 * self._LOCATION_PRECISION))
-            / 10**self._LOCATION_PRECISION
-        )
-        lats = (
-            self.coded_loc
-            - np.trunc(self.coded_loc / 10 ** (2 * self._LOCATION_PRECISION))
-            * 10 ** (2 * self._LOCATION_PRECISION)
-        ) / (10**self._LOCATION_PRECISION) - self._LAT_OFFSET
+        scale = 10**self._LOCATION_PRECISION
+        lon_part = np.trunc(self.coded_loc / scale**2)
+        lons = lon_part / scale
+        lats = (self.coded_loc - lon_part * scale**2) / scale - self._LAT_OFFSET
 
         return lats, lons
 
@@ -2293,18 +2353,22 @@ class UngriddedData:
         """
         if ignore_keys is None:
             ignore_keys = []
-        meta_registered = []
+        # only metadata blocks in the same bucket can be the same, so that
+        # each block needs to be compared only to few registered ones
+        buckets = {}
         same_indices = []
         for meta_key, meta in self.metadata.items():
+            registered = buckets.setdefault(_meta_bucket_key(meta, ignore_keys), [])
             found = False
-            for idx, meta_reg in enumerate(meta_registered):
+            for meta_reg, indices in registered:
                 if same_meta_dict(meta_reg, meta, ignore_keys=ignore_keys):
-                    same_indices[idx].append(meta_key)
+                    indices.append(meta_key)
                     found = True
 
             if not found:
-                meta_registered.append(meta)
-                same_indices.append([meta_key])
+                indices = [meta_key]
+                registered.append((meta, indices))
+                same_indices.append(indices)
 
         return same_indices
 
@@ -2399,7 +2463,8 @@ class UngriddedData:
         if not isinstance(other, UngriddedData):
             raise ValueError(f"Invalid input, need instance of UngriddedData, got: {type(other)}")
         if new_obj:
-            obj = self.copy()
+            # the data array of obj is replaced below, so it is not copied
+            obj = self._copy_shared_data()
         else:
             obj = self
 
@@ -2416,28 +2481,41 @@ class UngriddedData:
             data_offset = obj.shape[0]
 
             # add this offset to indices of meta dictionary in input data object
+            # (for all metadata blocks and variables at once)
+            other_indices = [
+                (meta_idx_other, var_name, np.asarray(indices, dtype=int))
+                for meta_idx_other in other.metadata
+                for var_name, indices in other.meta_idx[meta_idx_other].items()
+            ]
+            shifted = []
+            if other_indices:
+                all_indices = np.concatenate([indices for *_, indices in other_indices])
+                all_indices += data_offset
+                splits = np.cumsum([len(indices) for *_, indices in other_indices])[:-1]
+                shifted = np.split(all_indices, splits)
+
             for meta_idx_other, meta_other in other.metadata.items():
                 meta_idx = meta_offset + meta_idx_other
                 obj.metadata[meta_idx] = meta_other
-                _idx_map = {}
-                for var_name, indices in other.meta_idx[meta_idx_other].items():
-                    _idx_map[var_name] = np.asarray(indices) + data_offset
-                obj.meta_idx[meta_idx] = _idx_map
+                obj.meta_idx[meta_idx] = {}
+            for (meta_idx_other, var_name, _), indices in zip(other_indices, shifted):
+                obj.meta_idx[meta_offset + meta_idx_other][var_name] = indices
 
+            idx_exists = set(obj.var_idx.values())
+            max_idx = max(idx_exists, default=-1)
             for var, idx in other.var_idx.items():
                 if var in obj.var_idx:  # variable already exists in this object
                     if not idx == obj.var_idx[var]:
                         other.change_var_idx(var, obj.var_idx[var])
                 else:  # variable does not yet exist
-                    idx_exists = [v for v in obj.var_idx.values()]
                     if idx in idx_exists:
                         # variable index is already assigned to another
                         # variable and needs to be changed
-                        new_idx = max(idx_exists) + 1
-                        other.change_var_idx(var, new_idx)
-                        obj.var_idx[var] = new_idx
-                    else:
-                        obj.var_idx[var] = idx
+                        idx = max_idx + 1
+                        other.change_var_idx(var, idx)
+                    obj.var_idx[var] = idx
+                    idx_exists.add(idx)
+                    max_idx = max(max_idx, idx)
             obj._data = np.vstack([obj._data, other._data])
             obj.data_revision.update(other.data_revision)
         obj.filter_hist.update(other.filter_hist)
@@ -2514,8 +2592,8 @@ class UngriddedData:
             )
         cidx = self.var_idx[var_name]
         self.var_idx[var_name] = new_idx
-        var_indices = np.where(self._data[:, self._VARINDEX] == cidx)
-        self._data[var_indices, self._VARINDEX] = new_idx
+        var_col = self._data[:, self._VARINDEX]  # view, assignment changes _data
+        var_col[var_col == cidx] = new_idx
 
     def append(self, other):
         """Append other instance of :class:`UngriddedData` to this object
@@ -2563,7 +2641,7 @@ class UngriddedData:
         if var_name not in self.var_idx:
             raise AttributeError(f"Variable {var_name} not available in data")
         idx = self.var_idx[var_name]
-        mask = np.where(self._data[:, self._VARINDEX] == idx)[0]
+        mask = self._data[:, self._VARINDEX] == idx
         return self._data[mask, self._DATAINDEX]
 
     def num_obs_var_valid(self, var_name):
@@ -2651,53 +2729,45 @@ class UngriddedData:
                     f"Invalid input for check_vars_available. "
                     f"Need str or list-like, got: {check_vars_available}"
                 )
+            check_vars_available = frozenset(check_vars_available)
         lat_len = 111.0  # approximate length of latitude degree in km
         station_map = {}
-        stations_other = other.station_name
+        # metadata blocks of other object by station name
+        other_by_name = {}
+        for meta_idx_other, meta_other in other.metadata.items():
+            other_by_name.setdefault(meta_other.get("station_name"), []).append(
+                (meta_idx_other, meta_other)
+            )
         for meta_idx, meta in self.metadata.items():
             name = meta["station_name"]
             # bool that is used to accelerate things
             ok = True
-            if _check_vars:
-                for var in check_vars_available:
-                    try:
-                        if var not in meta["variables"]:
-                            logger.debug(f"No {var} in data of station {name} ({meta['data_id']})")
-                            ok = False
-                    except Exception:  # attribute does not exist or is not iterable
+            if _check_vars and not _meta_has_vars(meta, check_vars_available):
+                ok = False
+            if ok:
+                for meta_idx_other, meta_other in other_by_name.get(name, ()):
+                    if _check_vars and not _meta_has_vars(meta_other, check_vars_available):
                         ok = False
-            if ok and name in stations_other:
-                for meta_idx_other, meta_other in other.metadata.items():
-                    if meta_other["station_name"] == name:
-                        if _check_vars:
-                            for var in check_vars_available:
-                                try:
-                                    if var not in meta_other["variables"]:
-                                        logger.debug(
-                                            f"No {var} in data of station {name} ({meta_other['data_id']})"
-                                        )
-                                        ok = False
-                                except Exception:  # attribute does not exist or is not iterable
-                                    ok = False
-                        if ok and check_coordinates:
-                            dlat = abs(meta["latitude"] - meta_other["latitude"])
-                            dlon = abs(meta["longitude"] - meta_other["longitude"])
-                            lon_fac = np.cos(np.deg2rad(meta["latitude"]))
-                            # compute distance between both station coords
-                            dist = np.linalg.norm((dlat * lat_len, dlon * lat_len * lon_fac))
-                            if dist > max_diff_coords_km:
-                                logger.warning(
-                                    f"Coordinate of station {name} "
-                                    f"varies more than {max_diff_coords_km} km "
-                                    f"between {meta['data_id']} and {meta_other['data_id']} data. "
-                                    f"Retrieved distance: {dist:.2f} km "
-                                )
-                                ok = False
-                        if ok:  # match found
-                            station_map[meta_idx] = meta_idx_other
-                            logger.debug(f"Found station match {name}")
-                            # no need to further iterate over the rest
-                            continue
+                    if ok and check_coordinates:
+                        dlat = abs(meta["latitude"] - meta_other["latitude"])
+                        dlon = abs(meta["longitude"] - meta_other["longitude"])
+                        lon_fac = math.cos(math.radians(meta["latitude"]))
+                        # compute distance between both station coords
+                        # (scalar math, numpy is slow for single values)
+                        dist = math.hypot(dlat * lat_len, dlon * lat_len * lon_fac)
+                        if dist > max_diff_coords_km:
+                            logger.warning(
+                                f"Coordinate of station {name} "
+                                f"varies more than {max_diff_coords_km} km "
+                                f"between {meta['data_id']} and {meta_other['data_id']} data. "
+                                f"Retrieved distance: {dist:.2f} km "
+                            )
+                            ok = False
+                    if ok:  # match found
+                        station_map[meta_idx] = meta_idx_other
+                        logger.debug(f"Found station match {name}")
+                        # no need to further iterate over the rest
+                        break
 
         return station_map
 
@@ -2718,9 +2788,11 @@ class UngriddedData:
         )
         if len(common) == 0:
             raise DataExtractionError("None of the stations in the two match")
-        dates = []
-        data_this_match = []
-        data_other_match = []
+        # matches of each station pair (start with empty arrays, so that the
+        # concatenation below also works if there are no matches)
+        dates = [np.empty(0, dtype=np.int64)]
+        data_this_match = [np.empty(0)]
+        data_other_match = [np.empty(0)]
 
         for idx_this, idx_other in common.items():
             data_idx_this = self.meta_idx[idx_this][var_name]
@@ -2732,27 +2804,45 @@ class UngriddedData:
             # ... and corresponding data values of variable
             data_this = self._data[data_idx_this, self._DATAINDEX]
             data_other = other._data[data_idx_other, other._DATAINDEX]
-            # round to daily resolution. looks too complicated, but is much
-            # faster than pandas combined with datetime
-            date_nums_this = dtimes_this.astype("datetime64[s]").astype("M8[D]").astype(int)
-            date_nums_other = dtimes_other.astype("datetime64[s]").astype("M8[D]").astype(int)
-
-            # TODO: loop over shorter array
-            for idx, datenum in enumerate(date_nums_this):
-                matches = np.where(date_nums_other == datenum)[0]
-                if len(matches) == 1:
-                    dates.append(datenum)
-                    data_this_match.append(data_this[idx])
-                    data_other_match.append(data_other[matches[0]])
-
-        return (dates, data_this_match, data_other_match)
+            # invalid (NaN) timestamps can not be matched
+            valid = np.isfinite(dtimes_this)
+            dtimes_this, data_this = dtimes_this[valid], data_this[valid]
+            valid = np.isfinite(dtimes_other)
+            dtimes_other, data_other = dtimes_other[valid], data_other[valid]
+            # round to daily resolution (days since epoch)
+            date_nums_this = _seconds_to_days(dtimes_this)
+            date_nums_other = _seconds_to_days(dtimes_other)
+
+            # only days that occur exactly once in other can be matched
+            days, first, counts = np.unique(date_nums_other, return_index=True, return_counts=True)
+            single = counts == 1
+            if not single.any():
+                continue
+            days, first = days[single], first[single]
+            # find days of this object among them (in order of this object)
+            pos = np.searchsorted(days, date_nums_this).clip(max=len(days) - 1)
+            idx_this = np.flatnonzero(days[pos] == date_nums_this)
+            idx_other = first[pos[idx_this]]
+
+            dates.append(date_nums_this[idx_this])
+            data_this_match.append(data_this[idx_this])
+            data_other_match.append(data_other[idx_other])
+
+        return (
+            np.concatenate(dates),
+            np.concatenate(data_this_match),
+            np.concatenate(data_other_match),
+        )
 
     def _meta_to_lists(self):
-        meta = {k: [] for k in self.metadata[self.first_meta_idx]}
-        for meta_item in self.metadata.values():
-            for k, v in meta.items():
-                v.append(meta_item[k])
-        return meta
+        keys = list(self.metadata[self.first_meta_idx])
+        if not keys:
+            return {}
+        # extract all values of one metadata block in one call and transpose
+        rows = map(itemgetter(*keys), self.metadata.values())
+        if len(keys) == 1:
+            return {keys[0]: list(rows)}
+        return dict(zip(keys, map(list, zip(*rows))))
 
     def plot_station_timeseries(
         self,
@@ -2891,8 +2981,14 @@ class UngriddedData:
             info_str += f"_{ts_type}"
 
         if all([x is None for x in (var_name, start, stop)]):  # use all stations
-            all_meta = subset._meta_to_lists()
-            lons, lats = all_meta["longitude"], all_meta["latitude"]
+            # only the coordinates are needed, not all metadata
+            lons, lats = subset.longitude, subset.latitude
+
+        elif all([x is None for x in (start, stop, ts_type)]):
+            # no time constraints, no need to convert data to StationData
+            lons, lats = subset._coordinates_with_data(var_name)
+            if len(lons) == 0:
+                raise DataCoverageError(f"No stations with {var_name} data could be found")
 
         else:
             stat_data = subset.to_station_data_all(var_name, start, stop, ts_type)
@@ -3000,14 +3096,13 @@ class UngriddedData:
 
         if not isinstance(key, str):
             raise ValueError("Need string (e.g. variable name, station name, instrument name")
-        if key in self.contains_datasets:
-            return True
-        elif key in self.contains_vars:
-            return True
-        elif key in self.station_name:
-            return True
-        elif key in self.contains_instruments:
+        if key in self.var_idx:
             return True
+        # single pass over metadata that stops at the first match, instead of
+        # building the lists of datasets, station names and instruments
+        for meta in self.metadata.values():
+            if key in (meta.get("data_id"), meta.get("station_name"), meta.get("instrument_name")):
+                return True
         return False
 
     def __iter__(self):
@@ -3076,11 +3171,124 @@ class UngriddedData:
         return s
 
 
+def _datetime64_to_seconds(time):
+    """Convert time stamp to float seconds since epoch (unit of time column)"""
+    return (np.datetime64(time) - np.datetime64(0, "s")) / np.timedelta64(1, "s")
+
+
+def _seconds_to_days(seconds):
+    """Convert time column (seconds since epoch) to integer days since epoch
+
+    Same as casting via ``datetime64[s]`` and ``datetime64[D]`` to int, but
+    in a single pass without intermediate arrays. Input timestamps must be
+    finite, NaN (which corresponds to NaT) has no integer representation and
+    needs to be removed beforehand.
+    """
+    return (seconds // 86400).astype(np.int64)
+
+
+def _wildcard_matcher(pattern):
+    """Compile wildcard pattern into a function that checks a name against it
+
+    Equivalent to :func:`fnmatch.fnmatch` (incl. case normalisation), but the
+    pattern is translated and compiled only once, which is faster when many
+    names are checked against the same pattern.
+    """
+    match = re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+    def matches(name):
+        return match(os.path.normcase(name)) is not None
+
+    return matches
+
+
+def _meta_has_vars(meta, variables):
+    """Check if all input variables are listed in a metadata block
+
+    Parameters
+    ----------
+    meta : dict
+        metadata block (cf. :attr:`UngriddedData.metadata`)
+    variables : frozenset
+        variables that need to be listed in ``variables`` of the block
+
+    Returns
+    -------
+    bool
+        True, if all variables are listed, False if not or if the block has
+        no list of variables
+    """
+    avail = meta.get("variables")
+    if isinstance(avail, str):
+        avail = [avail]
+    elif not isinstance(avail, list | tuple | set | frozenset | np.ndarray):
+        return False
+    if missing := variables.difference(avail):
+        logger.debug(
+            f"No {', '.join(sorted(missing))} in data of station "
+            f"{meta.get('station_name')} ({meta.get('data_id')})"
+        )
+        return False
+    return True
+
+
+def _meta_bucket_key(meta, ignore_keys):
+    """Hashable key of a metadata dict for grouping of similar dicts
+
+    Dicts that are the same according to :func:`same_meta_dict` always have
+    the same key. Numerical coordinates (which are compared with tolerance)
+    and unhashable values (e.g. ``var_info``) are not part of the key.
+    """
+    items = []
+    for key, val in meta.items():
+        if key in ignore_keys or key in NUM_KEYS_META:
+            continue
+        if isinstance(val, (list, np.ndarray)):
+            val = tuple(val)
+        try:
+            hash(val)
+        except TypeError:
+            continue
+        items.append((key, val))
+    return frozenset(meta), frozenset(items)
+
+
+def _outlier_rows(data, var_idx, low, high):
+    """Find rows of one variable in a data array whose values are out of range
+
+    Parameters
+    ----------
+    data : ndarray
+        data array of :class:`UngriddedData`
+    var_idx : int
+        index of variable (cf. :attr:`UngriddedData.var_idx`)
+    low : float
+        lower end of valid range
+    high : float
+        upper end of valid range
+
+    Returns
+    -------
+    ndarray
+        row indices of outliers
+    """
+    # range check only the rows of this variable
+    rows = np.flatnonzero(data[:, UngriddedData._VARINDEX] == var_idx)
+    values = data[rows, UngriddedData._DATAINDEX]
+    return rows[(values < low) | (values > high)]
+
+
 def reduce_array_closest(arr_nominal, arr_to_be_reduced):
-    test = sorted(arr_to_be_reduced)
+    test = np.sort(np.asarray(arr_to_be_reduced))
     closest_idx = []
-    for num in sorted(arr_nominal):
-        idx = np.argmin(abs(test - num))
+    start = 0
+    for num in np.sort(np.asarray(arr_nominal)):
+        # closest value among the remaining values (by bisection)
+        remaining = test[start:]
+        idx = np.searchsorted(remaining, num)
+        if idx == len(remaining) or (idx > 0 and num - remaining[idx - 1] <= remaining[idx] - num):
+            # first occurrence of the closest value below num
+            idx = np.searchsorted(remaining, remaining[idx - 1])
         closest_idx.append(idx)
-        test = test[(idx + 1) :]
+        start += idx + 1
     return closest_idx
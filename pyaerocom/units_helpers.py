@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 import pandas as pd
 from cf_units import Unit
 
@@ -244,6 +246,11 @@ def _unit_conversion_fac_si(from_unit, to_unit):
         raise UnitConversionError(f"Failed to convert unit from {from_unit} to {to_unit}")
 
 
+#: :func:`_unit_conversion_fac_si` cached for unit strings (parsing with
+#: :mod:`cf_units` is slow and the same units are converted over and over)
+_unit_conversion_fac_si_str = lru_cache(maxsize=256)(_unit_conversion_fac_si)
+
+
 def _get_unit_conversion_fac_helper(from_unit, to_unit, var_name=None):
     """
     Helper for unit conversion
@@ -276,6 +283,8 @@ def _get_unit_conversion_fac_helper(from_unit, to_unit, var_name=None):
             # call of unit_conversion_fac_si below will crash
             pass
 
+    if isinstance(from_unit, str) and isinstance(to_unit, str):
+        return _unit_conversion_fac_si_str(from_unit, to_unit) * pre_conv_fac
     return _unit_conversion_fac_si(from_unit, to_unit) * pre_conv_fac
 
 
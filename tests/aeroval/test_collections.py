@@ -1,3 +1,5 @@
+import pytest
+
 from pyaerocom.aeroval.collections import ObsCollection, ModelCollection
 
 
@@ -26,3 +28,17 @@ def test_modelcollection():
     )
 
     assert "ECMWF_OSUITE" in mc
+
+
+def test_modelcollection_keylist():
+    mc = ModelCollection(
+        model1=dict(model_id="bla"),
+        model2=dict(model_id="blub"),
+        other=dict(model_id="bla"),
+    )
+    assert mc.keylist() == ["model1", "model2", "other"]
+    assert mc.keylist("model*") == ["model1", "model2"]
+    assert mc.keylist("other") == ["other"]
+
+    with pytest.raises(KeyError):
+        mc.keylist("nope*")
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
+import xarray as xr
 
 from pyaerocom import const
 from pyaerocom.io.cnemc.reader import ReadCNEMC
@@ -92,3 +94,25 @@ def test_read_error(reader: ReadCNEMC):
 
 def test_reader_gives_correct_mep_path(reader: ReadCNEMC, mep_path: Path):
     assert Path(reader.data_dir) == mep_path
+
+
+def test__open_dataset_cache(tmp_path: Path):
+    path = tmp_path / "mep-rd-1234A-test.nc"
+    xr.Dataset({"x": ("time", [1.0, 2.0])}).to_netcdf(path)
+    paths = (str(path),)
+
+    reader = ReadCNEMC(data_dir=str(tmp_path))
+    ds = reader._open_dataset(paths)
+    assert reader._open_dataset(paths) is ds
+
+    reader.clear_dataset_cache()
+    assert not reader._dataset_cache
+    ds = reader._open_dataset(paths)
+    assert reader._open_dataset(paths) is ds
+
+    # modified files are reopened, and the number of open datasets is limited
+    reader.MAX_CACHED_DATASETS = 1
+    os.utime(path, ns=(0, 0))
+    assert reader._open_dataset(paths) is not ds
+    assert len(reader._dataset_cache) == 1
+    reader.clear_dataset_cache()
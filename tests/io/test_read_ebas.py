@@ -24,7 +24,12 @@ from pyaerocom.exceptions import (
 )
 from pyaerocom.io.ebas_nasa_ames import EbasNasaAmesFile
 from pyaerocom.io.ebas_varinfo import EbasVarInfo
-from pyaerocom.io.read_ebas import ReadEbas, ReadEbasOptions
+from pyaerocom.io.read_ebas import (
+    ReadEbas,
+    ReadEbasOptions,
+    _init_worker_reader,
+    _read_file_in_worker,
+)
 from pyaerocom.stationdata import StationData
 from pyaerocom.ungriddeddata import UngriddedData
 
@@ -702,3 +707,43 @@ def test_read_error(reader: ReadEbas, ebas_files: list[Path]):
     with pytest.raises(DataCoverageError) as e:
         reader.read("ac550aer", files=ebas_files)
     assert str(e.value) == "UngriddedData object appears to be empty"
+
+
+@pytest.mark.parametrize("file_vars", ["concpm10"])
+def test_read_pool(reader: ReadEbas, ebas_files: list[Path]):
+    data = reader.read("concpm10", files=ebas_files)
+    data_pool = ReadEbas("EBASSubset").read("concpm10", files=ebas_files, pool=2)
+    assert data_pool.shape == data.shape
+    assert data_pool.station_name == data.station_name
+    np.testing.assert_array_equal(data_pool._data, data._data)
+
+
+@pytest.mark.parametrize("file_vars", ["concpm10"])
+def test_read_pool_per_call(monkeypatch, ebas_files: list[Path]):
+    reader = ReadEbas("EBASSubset")
+    pools = []
+    iter_read_files = reader._iter_read_files
+
+    def record_pool(files, files_contain, pool=1):
+        pools.append(pool)
+        return iter_read_files(files, files_contain, pool)
+
+    monkeypatch.setattr(reader, "_iter_read_files", record_pool)
+    # pr has its own reading options (VAR_READ_OPTS), the files contain no pr
+    with pytest.raises(DataCoverageError):
+        reader.read("pr", files=ebas_files, pool=2)
+    with pytest.raises(DataCoverageError):
+        reader.read("pr", files=ebas_files)
+    assert pools == [2, 1]
+    assert "pool" not in reader.readopts_default
+    assert "pool" not in reader.get_read_opts("pr")
+
+
+@pytest.mark.parametrize("file_vars", ["concpm10"])
+def test__read_file_in_worker(reader: ReadEbas, ebas_files: list[Path]):
+    _init_worker_reader(ReadEbas, reader.data_id, reader.data_dir, reader._opts)
+    for file in ebas_files:
+        data, err = _read_file_in_worker(str(file), ["concpm10"])
+        expected, _ = reader._read_file_or_error(str(file), ["concpm10"])
+        assert err is None
+        np.testing.assert_array_equal(data.concpm10, expected.concpm10)
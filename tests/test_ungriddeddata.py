@@ -1,11 +1,14 @@
 import string
+import warnings
 from pathlib import Path
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from pyaerocom import UngriddedData, ungriddeddata
 from pyaerocom.exceptions import DataCoverageError, VariableDefinitionError
+from pyaerocom.stationdata import StationData
 from tests.fixtures.stations import FAKE_STATION_DATA
 
 
@@ -28,6 +31,17 @@ def test_add_chunk(ungridded_empty):
     assert ungridded_empty.shape == (20000000, 12)
 
 
+def test_add_chunk_doubles():
+    data = UngriddedData(num_points=10)
+    data.add_chunk(1)
+    assert data.shape == (20, 12)
+    data.add_chunk(25)
+    assert data.shape == (45, 12)
+    data.add_chunk()
+    assert data.shape == (90, 12)
+    assert np.isnan(data._data).all()
+
+
 def test_coordinate_access():
     d = UngriddedData()
 
@@ -240,6 +254,51 @@ def test_from_single_station_data():
     assert data0 == pytest.approx(data1, abs=1e-20)
 
 
+def test_to_station_data_sorts_time():
+    stat = StationData()
+    stat.update(station_name="test", latitude=10.0, longitude=20.0, altitude=0.0)
+    stat["dtime"] = np.array(["2010-01-03", "2010-01-01", "2010-01-02"], dtype="datetime64[s]")
+    stat["concpm10"] = np.array([3.0, 1.0, 2.0])
+    stat.var_info["concpm10"] = {"units": "ug m-3"}
+    stat.data_err["concpm10"] = np.array([0.3, 0.1, 0.2])
+
+    sd = UngriddedData.from_station_data(stat).to_station_data(0)
+    assert np.all(np.diff(sd["dtime"]) > np.timedelta64(0, "s"))
+    assert sd["concpm10"].values == pytest.approx([1.0, 2.0, 3.0])
+    assert sd.data_err["concpm10"] == pytest.approx([0.1, 0.2, 0.3])
+
+
+def test_get_variable_data_different_time_axes():
+    stat = StationData()
+    stat.update(station_name="test", latitude=10.0, longitude=20.0, altitude=0.0)
+    stat["concpm10"] = pd.Series([1.0, 2.0, 3.0], index=pd.date_range("2010-01-01", periods=3))
+    stat["concpm25"] = pd.Series([4.0, 5.0], index=pd.date_range("2010-01-01", periods=2))
+    for var in ("concpm10", "concpm25"):
+        stat.var_info[var] = {"units": "ug m-3"}
+
+    data = UngriddedData.from_station_data(stat)
+    result = data.get_variable_data(["concpm10", "concpm25"])
+    assert result["concpm10"] == pytest.approx([1.0, 2.0, 3.0])
+    assert result["concpm25"] == pytest.approx([4.0, 5.0])
+    assert result["num_stats"] == {"concpm10": 1, "concpm25": 1}
+
+
+def test_to_station_data_empty_var_idx():
+    stat = StationData()
+    stat.update(station_name="test", latitude=10.0, longitude=20.0, altitude=0.0)
+    stat["dtime"] = np.array(["2010-01-01", "2010-01-02"], dtype="datetime64[s]")
+    for var in ("concpm10", "concpm25"):
+        stat[var] = np.array([1.0, 2.0])
+        stat.var_info[var] = {"units": "ug m-3"}
+
+    data = UngriddedData.from_station_data(stat)
+    # readers may register variables without any data rows
+    data.meta_idx[0]["concpm25"] = []
+    sd = data.to_station_data(0, start="2010-01-01", stop="2010-01-03")
+    assert "concpm10" in sd
+    assert "concpm25" not in sd
+
+
 def test_last_meta_idx(aeronetsunv3lev2_subset: UngriddedData):
     assert isinstance(aeronetsunv3lev2_subset.last_meta_idx, np.ndarray | np.generic)
 
@@ -261,6 +320,26 @@ def test_nonunique_station_names(aeronetsunv3lev2_subset: UngriddedData):
     assert isinstance(aeronetsunv3lev2_subset.nonunique_station_names, list)
 
 
+def test__station_name_index(aeronetsunv3lev2_subset: UngriddedData):
+    index = aeronetsunv3lev2_subset._station_name_index()
+    assert sorted(index) == aeronetsunv3lev2_subset.unique_station_names
+    for name, meta_idx in index.items():
+        assert meta_idx == aeronetsunv3lev2_subset._find_station_indices(name)
+
+
+@pytest.mark.parametrize("deep", [True, False])
+def test_copy(aeronetsunv3lev2_subset: UngriddedData, deep: bool):
+    data = aeronetsunv3lev2_subset
+    new = data.copy(deep=deep)
+    assert new.shape == data.shape
+    assert np.array_equal(new._data, data._data, equal_nan=True)
+    assert not np.shares_memory(new._data, data._data)
+    assert new.metadata == data.metadata
+    assert new.metadata is not data.metadata
+    key = data.first_meta_idx
+    assert (new.metadata[key] is data.metadata[key]) != deep
+
+
 def test_set_flags_nan_error(aeronetsunv3lev2_subset: UngriddedData):
     data = aeronetsunv3lev2_subset.copy()
     with pytest.raises(AttributeError):
@@ -293,3 +372,148 @@ def test_find_common_stations(aeronetsunv3lev2_subset: UngriddedData):
     data2 = aeronetsunv3lev2_subset.copy()
     station_map = data1.find_common_stations(other=data2)
     assert station_map == {key: key for key in station_map}
+
+
+@pytest.mark.parametrize(
+    "pattern,name,match",
+    [
+        ("*Potenza*", "Potenza", True),
+        ("Pot*", "Potenza", True),
+        ("Pot", "Potenza", False),
+        ("Potenz?", "Potenza", True),
+        ("[A-C]*", "Birkenes", True),
+        ("[A-C]*", "Potenza", False),
+    ],
+)
+def test__wildcard_matcher(pattern: str, name: str, match: bool):
+    assert ungriddeddata._wildcard_matcher(pattern)(name) == match
+
+
+def test__outlier_rows():
+    data = UngriddedData(num_points=5)
+    data._data[:, data._VARINDEX] = [0, 0, 1, 0, 1]
+    data._data[:, data._DATAINDEX] = [-1, 0.5, 5, 2, np.nan]
+    rows = ungriddeddata._outlier_rows(data._data, 0, 0, 1)
+    assert rows.tolist() == [0, 3]
+
+
+def test__meta_bucket_key():
+    meta = dict(station_name="Potenza", latitude=40.6, PI="a", var_info={"od550aer": {}})
+    key = ungriddeddata._meta_bucket_key(meta, ["PI"])
+    assert key == ungriddeddata._meta_bucket_key(dict(meta, latitude=40.61, PI="b"), ["PI"])
+    assert key != ungriddeddata._meta_bucket_key(dict(meta, station_name="Leipzig"), ["PI"])
+    assert key != ungriddeddata._meta_bucket_key(dict(meta, altitude=10), ["PI"])
+
+
+def test__add_to_filter_history():
+    data = UngriddedData(num_points=1)
+    data._add_to_filter_history("first")
+    data._add_to_filter_history("second")
+    assert list(data.filter_hist.values()) == ["first", "second"]
+    assert data.last_filter_applied() == "second"
+
+
+def test___contains__():
+    data = UngriddedData(num_points=1)
+    data.metadata[0] = dict(data_id="obs", station_name="Potenza", instrument_name=None)
+    data.var_idx["od550aer"] = 0
+    for key in ("obs", "Potenza", "od550aer"):
+        assert key in data
+    assert "Leipzig" not in data
+
+
+@pytest.mark.parametrize(
+    "nominal,to_be_reduced,result",
+    [
+        ([1, 5], [0, 1, 2, 5, 6], [1, 1]),
+        ([2, 3], [1, 1, 4], [0, 1]),
+        ([0.4, 0.6], np.arange(5.0), [0, 0]),
+    ],
+)
+def test_reduce_array_closest(nominal: list, to_be_reduced: list, result: list):
+    assert ungriddeddata.reduce_array_closest(nominal, to_be_reduced) == result
+
+
+@pytest.mark.parametrize(
+    "meta,result",
+    [
+        (dict(variables=["od550aer", "ang4487aer"]), True),
+        (dict(variables=("od550aer",)), False),
+        (dict(variables="od550aer"), False),
+        (dict(variables=None), False),
+        (dict(), False),
+    ],
+)
+def test__meta_has_vars(meta: dict, result: bool):
+    variables = frozenset(["od550aer", "ang4487aer"])
+    assert ungriddeddata._meta_has_vars(meta, variables) == result
+
+
+def test__seconds_to_days():
+    seconds = np.array([0, 86399.5, 86400, 1.7e9])
+    days = seconds.astype("datetime64[s]").astype("datetime64[D]").astype(int)
+    assert np.array_equal(ungriddeddata._seconds_to_days(seconds), days)
+
+
+def test_find_common_data_points_nan_time():
+    stat = StationData()
+    stat.update(station_name="test", latitude=10.0, longitude=20.0, altitude=0.0)
+    stat.data_id = "test"
+    stat["dtime"] = np.array(["2010-01-01", "2010-01-02", "2010-01-03"], dtype="datetime64[s]")
+    stat["concpm10"] = np.array([1.0, 2.0, 3.0])
+    stat.var_info["concpm10"] = {"units": "ug m-3"}
+
+    data = UngriddedData.from_station_data(stat)
+    data.metadata[0]["variables"] = ["concpm10"]
+    other = data.copy()
+    data._data[0, data._TIMEINDEX] = np.nan
+    other._data[2, other._TIMEINDEX] = np.nan
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        dates, data_this, data_other = data.find_common_data_points(other, "concpm10")
+    assert dates.tolist() == [np.datetime64("2010-01-02", "D").astype(int)]
+    assert data_this == pytest.approx([2.0])
+    assert data_other == pytest.approx([2.0])
+
+
+@pytest.mark.parametrize(
+    "metadata,expected",
+    [
+        ({0: {}, 1: {"a": 1}}, {}),
+        ({0: {"a": 1}, 1: {"a": 2}}, {"a": [1, 2]}),
+        ({0: {"a": 1, "b": "x"}, 1: {"a": 2, "b": "y"}}, {"a": [1, 2], "b": ["x", "y"]}),
+    ],
+)
+def test__meta_to_lists(metadata: dict, expected: dict):
+    data = UngriddedData(num_points=0)
+    data.metadata = metadata
+    assert data._meta_to_lists() == expected
+
+
+def test__new_from_meta_blocks_add_cols():
+    data = UngriddedData(num_points=3, add_cols=["extra"])
+    data._data[:, data._DATAINDEX] = [1, 2, 3]
+    data._data[:, data._index["extra"]] = [4, 5, 6]
+    data._data[:, data._VARINDEX] = 0
+    data.var_idx["concpm10"] = 0
+    for idx, rows in enumerate([[0], [1, 2]]):
+        data.metadata[idx] = dict(station_name=f"s{idx}", var_info={"concpm10": {}})
+        data.meta_idx[idx] = {"concpm10": np.asarray(rows)}
+        data._data[rows, data._METADATAKEYINDEX] = idx
+
+    new = data._new_from_meta_blocks([1])
+    assert new._index == data._index
+    assert new._data[:, new._index["extra"]] == pytest.approx([5, 6])
+    assert new._data[:, new._METADATAKEYINDEX] == pytest.approx([0, 0])
+    assert new._chunksize == 2
+
+
+def test__coordinates_with_data():
+    data = UngriddedData(num_points=4)
+    data._data[:, data._DATAINDEX] = [1, 2, np.nan, 3]
+    for idx, (name, rows) in enumerate([("a", [0]), ("a", [1]), ("b", [2]), ("c", [3])]):
+        data.metadata[idx] = dict(station_name=name, longitude=idx, latitude=-idx)
+        data.meta_idx[idx] = {"od550aer": np.asarray(rows)}
+    assert data._coordinates_with_data("od550aer") == ([0, 3], [0, -3])
+    assert data._coordinates_with_data("ang4487aer") == ([], [])